@@ -47,6 +47,8 @@ def pprint_ports(ports: dict[str, Port] or list[Port]) -> None:
 
 
 class Label(_Label):
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return f"Label(text={self.text!r}, origin={self.origin}, layer=({self.layer}, {self.texttype}))"
 
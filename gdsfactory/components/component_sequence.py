@@ -114,6 +114,12 @@ def component_sequence(
     named_references_counter = Counter()
     ports_map = ports_map or {}
 
+    # Resolve each symbol once instead of once per sequence character
+    symbol_to_component = {
+        symbol: (gf.get_component(spec), input_port, output_port)
+        for symbol, (spec, input_port, output_port) in symbol_to_component.items()
+    }
+
     component = Component()
 
     # Add first component reference and input port
@@ -155,7 +161,6 @@ def component_sequence(
 
         index += 1
         component_i, input_port, next_port = symbol_to_component[s]
-        component_i = gf.get_component(component_i)
 
         named_references_counter.update({s: 1})
         alias = f"{s}{named_references_counter[s]}"
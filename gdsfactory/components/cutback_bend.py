@@ -63,10 +63,9 @@ def cutback_bend(
     }
 
     # Generate the sequence of staircases
-    s = ""
-    for i in range(cols):
-        s += "ASBS" * rows
-        s += "ASAS" if i % 2 == 0 else "BSBS"
+    s = "".join(
+        "ASBS" * rows + ("ASAS" if i % 2 == 0 else "BSBS") for i in range(cols)
+    )
     s = s[:-4]
 
     c = component_sequence(
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from functools import partial
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.cell import cell
 from gdsfactory.component import Component
@@ -10,6 +12,19 @@ from gdsfactory.snap import snap_to_grid
 from gdsfactory.typings import CrossSectionSpec, LayerSpec
 
 
+def _taper_polygon(
+    length: float, y1: float, y2: float
+) -> tuple[list[float], list[float]]:
+    """Returns (xpts, ypts) for a taper trapezoid symmetric around the x axis.
+
+    Args:
+        length: taper length.
+        y1: half-width at x=0.
+        y2: half-width at x=length.
+    """
+    return [0, length, length, 0], [y1, y2, -y2, -y1]
+
+
 @cell
 def taper(
     length: float = 10.0,
@@ -47,7 +62,7 @@ def taper(
     x = gf.get_cross_section(cross_section, **kwargs)
     layer = x.layer
 
-    if isinstance(port, gf.Port) and width1 is None:
+    if isinstance(port, Port) and width1 is None:
         width1 = port.width
 
     width2 = width2 or width1
@@ -58,24 +73,18 @@ def taper(
 
     y1 = width1 / 2
     y2 = width2 / 2
-    x1 = x.model_copy(update=dict(width=width1))
-    x2 = x.model_copy(update=dict(width=width2))
+    x1 = x.copy(width=width1)
+    x2 = x.copy(width=width2)
 
     if length:
-        xpts = [0, length, length, 0]
-        ypts = [y1, y2, -y2, -y1]
-        c.add_polygon((xpts, ypts), layer=layer)
+        if width1 or width2:
+            c.add_polygon(_taper_polygon(length, y1, y2), layer=layer)
 
-        x1 = x.copy(width=width1)
-        x2 = x.copy(width=width2)
-
-        xpts = [0, length, length, 0]
+        dw = width2 - width1
         for section in x.sections[1:]:
-            layer = section.layer
             y1 = section.width / 2
-            y2 = y1 + (width2 - width1)
-            ypts = [y1, y2, -y2, -y1]
-            c.add_polygon((xpts, ypts), layer=layer)
+            y2 = y1 + dw
+            c.add_polygon(_taper_polygon(length, y1, y2), layer=section.layer)
 
     c.add_port(
         name=port_order_name[0],
@@ -99,7 +108,7 @@ def taper(
 
     if with_bbox and length:
         x.add_bbox(c)
-    if add_pins and x.add_pins:
+    if add_pins and x.add_pins_function_name:
         x.add_pins(c)
 
     c.info["length"] = length
@@ -166,15 +175,16 @@ def taper_strip_to_ridge(
 
     c = gf.Component()
     for _t in [taper_wg, taper_slab]:
-        taper_ref = _t.ref()
-        c.add(taper_ref)
-        c.absorb(taper_ref)
+        for polygon in _t.get_polygons(
+            by_spec=False, include_paths=False, as_array=False
+        ):
+            c.add_polygon(polygon)
 
     c.info["length"] = length
     c.add_port(name="o1", port=taper_wg.ports["o1"])
     c.add_port(name="o2", port=taper_slab.ports["o2"])
     # Add pins instead only on the final component
-    if xs.add_pins:
+    if xs.add_pins_function_name:
         xs.add_pins(c)
 
     if length:
@@ -208,21 +218,18 @@ def taper_strip_to_ridge_trenches(
     yL = width / 2 + trench_width - trench_offset + slab_offset
 
     # straight
-    x = [0, length, length, 0]
-    yw = [y0, yL, -yL, -y0]
+    x, yw = _taper_polygon(length, y0, yL)
     if length:
         c.add_polygon((x, yw), layer=layer_wg)
 
-        # top trench
-        ymin0 = width / 2
-        yminL = width / 2
-        ymax0 = width / 2 + trench_width
-        ymaxL = width / 2 + trench_width + slab_offset
-        x = [0, length, length, 0]
-        ytt = [ymin0, yminL, ymaxL, ymax0]
-        ytb = [-ymin0, -yminL, -ymaxL, -ymax0]
-        c.add_polygon((x, ytt), layer=trench_layer)
-        c.add_polygon((x, ytb), layer=trench_layer)
+        # top trench, mirrored for the bottom one, added in a single call
+        ymin = width / 2
+        ymax = width / 2 + trench_width
+        ytt = np.array([ymin, ymin, ymax + slab_offset, ymax])
+        trenches = snap_to_grid(
+            np.stack((np.column_stack((x, ytt)), np.column_stack((x, -ytt))))
+        )
+        c.add_polygon(trenches, layer=trench_layer)
 
     c.add_port(name="o1", center=(0, 0), width=width, orientation=180, layer=layer_wg)
     c.add_port(
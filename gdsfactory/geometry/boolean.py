@@ -87,7 +87,10 @@ def boolean(
         )
 
     # Check for trivial solutions
-    if (not A_polys or not B_polys) and operation != "or":
+    if operation == "or" and len(A_polys) + len(B_polys) == 1:
+        # the union of a single (simple) polygon is the polygon itself
+        p = A_polys or B_polys
+    elif (not A_polys or not B_polys) and operation != "or":
         if (
             operation != "not"
             and operation != "and"
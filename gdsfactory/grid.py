@@ -97,13 +97,8 @@ def grid(
         else:
             remainder = shape[0] * shape[1] - device_array.size
         if remainder != 0:
-            device_array = np.append(
-                device_array,
-                [
-                    None,
-                ]
-                * remainder,
-            )
+            padding = np.full(remainder, None, dtype=object)
+            device_array = np.concatenate((device_array.ravel(), padding))
     device_array = np.reshape(device_array, shape)
     prefix_to_ref = {}
 
@@ -1460,13 +1460,15 @@ def spiral_archimedean(
         p.plot()
 
     """
-    return Path(
-        [
-            (separation / np.pi * theta + min_bend_radius)
-            * np.array((np.sin(theta), np.cos(theta)))
-            for theta in np.linspace(0, number_of_loops * 2 * np.pi, npoints)
-        ]
-    )
+    theta = np.linspace(0, number_of_loops * 2 * np.pi, npoints)
+    points = np.empty((npoints, 2))
+    np.sin(theta, out=points[:, 0])
+    np.cos(theta, out=points[:, 1])
+    # reuse theta as the radius vector once the trig terms are computed
+    theta *= separation / np.pi
+    theta += min_bend_radius
+    points *= theta[:, np.newaxis]
+    return Path(points)
 
 
 def _compute_segments(points):
@@ -758,7 +758,16 @@ def get_cross_section(
     return get_active_pdk().get_cross_section(cross_section, **kwargs)
 
 
+_layer_cache: dict[str, Layer] = {}
+
+
 def get_layer(layer: LayerSpec) -> Layer:
+    if isinstance(layer, str):
+        try:
+            return _layer_cache[layer]
+        except KeyError:
+            _layer_cache[layer] = get_active_pdk().get_layer(layer)
+            return _layer_cache[layer]
     return get_active_pdk().get_layer(layer)
 
 
@@ -837,6 +846,12 @@ on_yaml_cell_registered: Event = Event()
 on_yaml_cell_modified: Event = Event()
 on_cross_section_registered: Event = Event()
 
+
+def _clear_layer_cache(**kwargs) -> None:
+    _layer_cache.clear()
+
+
+on_pdk_activated.add_handler(_clear_layer_cache)
 on_container_registered.add_handler(on_cell_registered.fire)
 on_yaml_cell_registered.add_handler(on_cell_registered.fire)
 on_yaml_cell_modified.add_handler(show)
@@ -87,6 +87,25 @@ class Port:
         enforce_ports_on_grid: True snap port to grid.
     """
 
+    __slots__ = (
+        "name",
+        "center",
+        "orientation",
+        "parent",
+        "info",
+        "port_type",
+        "cross_section",
+        "shear_angle",
+        "layer",
+        "width",
+        # set lazily by ComponentReference.ports on its local port copies
+        "reference",
+        # set lazily by the auto_rename helpers below
+        "name_original",
+        # written by Component.get_ports and get_bundle_corner._transform_ports
+        "new_orientation",
+    )
+
     def __init__(
         self,
         name: str,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from functools import partial
 
+import numpy as np
+
 import gdsfactory as gf
 from gdsfactory.component import Component
 from gdsfactory.components.pad import pad_array as pad_array_function
@@ -80,8 +82,10 @@ def add_electrical_pads_top(
     pads.ymin = ref.ymax + spacing[1]
     ports_pads = list(pads.ports.values())
 
-    ports_pads = gf.routing.sort_ports.sort_ports_x(ports_pads)
-    ports_component = gf.routing.sort_ports.sort_ports_x(ports_electrical)
+    order = np.argsort([port.x for port in ports_pads], kind="stable")
+    ports_pads = [ports_pads[i] for i in order]
+    order = np.argsort([port.x for port in ports_electrical], kind="stable")
+    ports_component = [ports_electrical[i] for i in order]
 
     for p1, p2 in zip(ports_component, ports_pads):
         _ = c << route_quad(p1, p2, layer=layer)
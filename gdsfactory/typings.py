@@ -271,12 +271,16 @@ RouteFactory = Callable[..., Route]
 class TypedArray(np.ndarray):
     """based on https://github.com/samuelcolvin/pydantic/issues/380."""
 
+    __slots__ = ()
+
     @classmethod
     def __get_validators__(cls):
         yield cls.validate_type
 
     @classmethod
     def validate_type(cls, val, _info):
+        if isinstance(val, np.ndarray) and val.dtype == cls.inner_type:
+            return val
         return np.array(val, dtype=cls.inner_type)
 
 
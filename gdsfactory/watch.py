@@ -6,12 +6,11 @@ import logging
 import pathlib
 import sys
 import threading
-import time
 import traceback
 from collections.abc import Callable
 
 from IPython.terminal.embed import embed
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from watchdog.observers import Observer
 
 from gdsfactory.cell import CACHE, clear_cache, remove_from_cache
@@ -21,16 +20,16 @@ from gdsfactory.read.from_yaml_template import cell_from_yaml_template
 from gdsfactory.typings import ComponentSpec
 
 
-class FileWatcher(FileSystemEventHandler):
+class FileWatcher(PatternMatchingEventHandler):
     """Captures *.py or *.pic.yml file change events."""
 
     def __init__(self, logger=None, path: str | None = None) -> None:
         """Initialize the YAML event handler."""
-        super().__init__()
+        super().__init__(patterns=["*.pic.yml", "*.py"], ignore_directories=True)
 
         self.logger = logger or logging.root
-        pdk = get_active_pdk()
-        pdk.register_cells_yaml(dirpath=path, update=True)
+        self.pdk = get_active_pdk()
+        self.pdk.register_cells_yaml(dirpath=path, update=True)
 
         self.observer = Observer()
         self.path = path
@@ -40,6 +39,7 @@ class FileWatcher(FileSystemEventHandler):
 
     def _on_pdk_activated(self, new_pdk, old_pdk):
         clear_cache()
+        self.pdk = new_pdk
         new_pdk.register_cells_yaml(dirpath=self.path, update=True)
 
     def start(self) -> None:
@@ -48,10 +48,8 @@ class FileWatcher(FileSystemEventHandler):
         self.thread.start()
 
     def run(self) -> None:
-        while not self.stopping.is_set():
-            if not self.observer.is_alive():
-                self.observer.start()
-            time.sleep(1)
+        self.observer.start()
+        self.stopping.wait()
         self.observer.stop()
         self.observer.join()
 
@@ -70,9 +68,11 @@ class FileWatcher(FileSystemEventHandler):
             The cell function parsed from the yaml file.
         """
 
-        pdk = get_active_pdk()
-        print(f"Active PDK: {pdk.name}")
-        filepath = pathlib.Path(src_path)
+        pdk = self.pdk
+        self.logger.info("Active PDK: %s", pdk.name)
+        filepath = (
+            src_path if isinstance(src_path, pathlib.Path) else pathlib.Path(src_path)
+        )
         cell_name = filepath.stem.split(".")[0]
         if cell_name in CACHE:
             CACHE.pop(cell_name)
@@ -86,47 +86,30 @@ class FileWatcher(FileSystemEventHandler):
     def on_moved(self, event) -> None:
         super().on_moved(event)
 
-        what = "directory" if event.is_directory else "file"
-        if what == "file" and event.dest_path.endswith(".pic.yml"):
-            self.logger.info("Moved %s: %s", what, event.src_path)
+        if event.dest_path.endswith(".pic.yml"):
+            self.logger.info("Moved file: %s", event.src_path)
             self.update_cell(event.dest_path)
             self.get_component(event.src_path)
 
     def on_created(self, event) -> None:
         super().on_created(event)
 
-        what = "directory" if event.is_directory else "file"
-        if (
-            what == "file"
-            and event.src_path.endswith(".pic.yml")
-            or event.src_path.endswith(".py")
-        ):
-            self.logger.info("Created %s: %s", what, event.src_path)
-            self.get_component(event.src_path)
+        self.logger.info("Created file: %s", event.src_path)
+        self.get_component(event.src_path)
 
     def on_deleted(self, event) -> None:
         super().on_deleted(event)
 
-        what = "directory" if event.is_directory else "file"
-
-        if what == "file" and event.src_path.endswith(".pic.yml"):
-            self.logger.info("Deleted %s: %s", what, event.src_path)
-            pdk = get_active_pdk()
-            filepath = pathlib.Path(event.src_path)
-            cell_name = filepath.stem.split(".")[0]
-            pdk.remove_cell(cell_name)
+        if event.src_path.endswith(".pic.yml"):
+            self.logger.info("Deleted file: %s", event.src_path)
+            cell_name = pathlib.Path(event.src_path).stem.split(".")[0]
+            self.pdk.remove_cell(cell_name)
 
     def on_modified(self, event) -> None:
         super().on_modified(event)
 
-        what = "directory" if event.is_directory else "file"
-        if (
-            what == "file"
-            and event.src_path.endswith(".pic.yml")
-            or event.src_path.endswith(".py")
-        ):
-            self.logger.info("Modified %s: %s", what, event.src_path)
-            self.get_component(event.src_path)
+        self.logger.info("Modified file: %s", event.src_path)
+        self.get_component(event.src_path)
 
     def update(self):
         pass
@@ -169,7 +152,9 @@ def watch(path: pathlib.Path | str | None = cwd, pdk: str | None = None) -> None
     watcher = FileWatcher(path=path)
     watcher.start()
     logging.info(
-        f"File watcher looking for changes in *.py and *.pic.yml files in {path!r}. Stop with Ctrl+C"
+        "File watcher looking for changes in *.py and *.pic.yml files in %r. "
+        "Stop with Ctrl+C",
+        path,
     )
     embed()
     watcher.stop()